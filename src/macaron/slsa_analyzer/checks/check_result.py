@@ -2,9 +2,14 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
 """This module contains the CheckResult class for storing the result of a check."""
+import operator
+from array import array
+from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from typing import TypedDict
+from weakref import WeakKeyDictionary
 
 from macaron.database.table_definitions import CheckFacts
 from macaron.slsa_analyzer.slsa_req import BUILD_REQ_DESC, ReqName
@@ -24,7 +29,11 @@ class CheckResultType(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
-@dataclass
+#: The check result types that are considered as False.
+_FALSY_RESULT_TYPES = frozenset({CheckResultType.FAILED, CheckResultType.UNKNOWN})
+
+
+@dataclass(slots=True)
 class Evidence:
     """The class representing an evidence generated by a check."""
 
@@ -39,7 +48,13 @@ class Evidence:
 
 
 class EvidenceWeightMap:
-    """This class creates a map object for collected evidence."""
+    """This class creates a map object for collected evidence.
+
+    The evidence weights and results are stored in parallel arrays indexed by the evidence name,
+    so that the scores can be computed without accessing the attributes of each evidence.
+    """
+
+    __slots__ = ("_index", "_weights", "_found", "_cached_scores")
 
     def __init__(self, evidence_list: list[Evidence]) -> None:
         """Initialize the class.
@@ -49,19 +64,43 @@ class EvidenceWeightMap:
         evidence_list: list[Evidence]
             The list of evidences.
         """
-        self.map_obj: dict[str, Evidence] = {}
+        self._index: dict[str, int] = {}
+        self._weights: array[float] = array("d")
+        self._found: array[int] = array("b")
+        # The cached (score, max_score) pair, which is invalidated whenever the map changes.
+        self._cached_scores: tuple[float, float] | None = None
         for evidence in evidence_list:
             self.add(evidence)
 
+    def __iter__(self) -> Iterator[Evidence]:
+        """Iterate over the evidences in this map.
+
+        Yields
+        ------
+        Evidence
+            The evidence objects reconstructed from the stored results and weights.
+        """
+        for name, idx in self._index.items():
+            yield Evidence(name=name, found=bool(self._found[idx]), weight=self._weights[idx])
+
     def add(self, evidence: Evidence) -> None:
         """Add an evidence to the map.
 
+        If an evidence with the same name already exists, it is replaced.
+
         Parameters
         ----------
         evidence: Evidence
             The evidence object.
         """
-        self.map_obj[evidence.name] = evidence
+        if (idx := self._index.get(evidence.name)) is not None:
+            self._weights[idx] = evidence.weight
+            self._found[idx] = evidence.found
+        else:
+            self._index[evidence.name] = len(self._weights)
+            self._weights.append(evidence.weight)
+            self._found.append(evidence.found)
+        self._cached_scores = None
 
     def update_result(self, name: str, found: bool) -> None:
         """Update the result if an evidence is found.
@@ -71,8 +110,24 @@ class EvidenceWeightMap:
         found: bool
             True if evidence was found.
         """
-        if evidence := self.map_obj.get(name):
-            evidence.found = found
+        if (idx := self._index.get(name)) is not None:
+            self._found[idx] = found
+            self._cached_scores = None
+
+    def get_scores(self) -> tuple[float, float]:
+        """Compute the score and the maximum possible score of this map.
+
+        Returns
+        -------
+        tuple[float, float]
+            The aggregate score and the maximum possible score, or zeros if the map is empty.
+        """
+        if self._cached_scores is None:
+            self._cached_scores = (
+                sum(map(operator.mul, self._weights, self._found)),
+                sum(self._weights),
+            )
+        return self._cached_scores
 
     def get_max_score(self) -> float:
         """Get the maximum possible score in this map.
@@ -82,7 +137,7 @@ class EvidenceWeightMap:
         float
             The maximum possible score or zero if the map is empty.
         """
-        return sum(e.weight for e in self.map_obj.values())
+        return self.get_scores()[1]
 
     def get_score(self) -> float:
         """Compute the score using the evidence result and weights.
@@ -92,7 +147,7 @@ class EvidenceWeightMap:
         float
             The aggregate score or zero if the map is empty.
         """
-        return sum(e.weight * int(e.found) for e in self.map_obj.values())
+        return self.get_scores()[0]
 
 
 class Confidence(float, Enum):
@@ -123,13 +178,11 @@ class Confidence(float, Enum):
             The map that contains the detected evidence and their corresponding weight.
 
         """
-        max_score = evidence_weight_map.get_max_score()
+        score, max_score = evidence_weight_map.get_scores()
         # If the maximum score is zero, there is no need to normalize and just return the highest confidence level.
         if max_score == 0:
             return cls.HIGH
 
-        score = evidence_weight_map.get_score()
-
         # If the difference is zero, there is no need to normalize.
         if cls.HIGH - cls.LOW == 0:
             return cls.HIGH
@@ -137,7 +190,19 @@ class Confidence(float, Enum):
         normalized_score = score / max_score
 
         # Return the confidence level that is closest to the normalized score.
-        return min(cls, key=lambda c: abs(c.value - normalized_score))
+        high_medium_midpoint, medium_low_midpoint = _CONFIDENCE_MIDPOINTS
+        if normalized_score >= high_medium_midpoint:
+            return cls.HIGH
+        if normalized_score >= medium_low_midpoint:
+            return cls.MEDIUM
+        return cls.LOW
+
+
+#: The midpoints between adjacent confidence levels, used to find the level closest to a normalized score.
+_CONFIDENCE_MIDPOINTS = (
+    (Confidence.HIGH + Confidence.MEDIUM) / 2,
+    (Confidence.MEDIUM + Confidence.LOW) / 2,
+)
 
 
 class JustificationType(str, Enum):
@@ -150,6 +215,47 @@ class JustificationType(str, Enum):
     HREF = "href"
 
 
+#: The justification elements used when a check result has no justifications.
+_DEFAULT_JUSTIFICATION_ELEMENTS: tuple[str, ...] = ("Not Available.",)
+
+# Enum members are singletons, so the justification types can be compared by identity.
+_HREF = JustificationType.HREF
+_TEXT = JustificationType.TEXT
+
+#: Cache of the columns with "justification" metadata for each CheckFacts subclass.
+_JUSTIFY_SCHEMA_CACHE: WeakKeyDictionary[type, tuple[tuple[str, JustificationType], ...]] = WeakKeyDictionary()
+
+
+def _get_justification_columns(facts_type: type[CheckFacts]) -> tuple[tuple[str, JustificationType], ...]:
+    """Return the names and justification types of the columns that have "justification" metadata.
+
+    The column metadata is defined on the ORM class, so it is only inspected once per class.
+
+    Parameters
+    ----------
+    facts_type: type[CheckFacts]
+        The ORM class of the check facts.
+
+    Returns
+    -------
+    tuple[tuple[str, JustificationType], ...]
+        The column names paired with their justification types.
+    """
+    columns = _JUSTIFY_SCHEMA_CACHE.get(facts_type)
+    if columns is None:
+        justification_columns: list[tuple[str, JustificationType]] = []
+        for col in facts_type.__table__.columns:
+            justification = col.info.get("justification")
+            # Columns with other justification values are ignored.
+            if justification == JustificationType.HREF:
+                justification_columns.append((col.name, _HREF))
+            elif justification == JustificationType.TEXT:
+                justification_columns.append((col.name, _TEXT))
+        columns = tuple(justification_columns)
+        _JUSTIFY_SCHEMA_CACHE[facts_type] = columns
+    return columns
+
+
 @dataclass(frozen=True)
 class CheckInfo:
     """This class identifies and describes a check."""
@@ -163,6 +269,16 @@ class CheckInfo:
     #: The list of SLSA requirements that this check addresses.
     eval_reqs: list[ReqName]
 
+    @cached_property
+    def eval_req_descriptions(self) -> tuple[str, ...]:
+        """Return the textual descriptions of the SLSA requirements that this check addresses.
+
+        Returns
+        -------
+        tuple[str, ...]
+        """
+        return tuple(str(BUILD_REQ_DESC.get(req)) for req in self.eval_reqs)
+
 
 @dataclass(frozen=True)
 class CheckResultData:
@@ -174,21 +290,20 @@ class CheckResultData:
     #: Result type of the check (e.g. PASSED).
     result_type: CheckResultType
 
-    @property
-    def justification_report(self) -> list[tuple[Confidence, list]]:
-        """
-        Return a sorted list of justifications based on confidence scores in descending order.
+    @cached_property
+    def _justification_list(self) -> list[tuple[Confidence, list]]:
+        """Return the unsorted list of justifications generated from the result tables.
 
-        These justifications are generated from the tables in the database.
-        Note that the elements in the justification will be rendered differently based on their types:
-
-        * a :class:`JustificationType.TEXT` element is displayed in plain text in the HTML report.
-        * a :class:`JustificationType.HREF` element is rendered as a hyperlink in the HTML report.
+        If there are no justifications available, the list contains a default "Not Available" one.
 
         Returns
         -------
         list[tuple[Confidence, list]]
         """
+        # Checks that produce no result tables do not need to go through the justification columns.
+        if not self.result_tables:
+            return [(Confidence.HIGH, list(_DEFAULT_JUSTIFICATION_ELEMENTS))]
+
         justification_list: list = []
         for result in self.result_tables:
             # The HTML report generator requires the justification elements that need to be rendered in HTML
@@ -198,13 +313,14 @@ class CheckResultData:
             list_elements: list[str | dict] = []
 
             # Look for columns that are have "justification" metadata.
-            for col in result.__table__.columns:
-                column_value = getattr(result, col.name)
-                if col.info.get("justification") and column_value:
-                    if col.info.get("justification") == JustificationType.HREF:
-                        dict_elements[col.name] = column_value
-                    elif col.info.get("justification") == JustificationType.TEXT:
-                        list_elements.append(f"{col.name}: {column_value}")
+            for col_name, justification in _get_justification_columns(type(result)):
+                column_value = getattr(result, col_name)
+                if not column_value:
+                    continue
+                if justification is _HREF:
+                    dict_elements[col_name] = column_value
+                elif justification is _TEXT:
+                    list_elements.append(f"{col_name}: {column_value}")
 
             # Add the dictionary elements to the list of justification elements.
             if dict_elements:
@@ -215,10 +331,42 @@ class CheckResultData:
 
         # If there are no justifications available, return a default "Not Available" one.
         if not justification_list:
-            return [(Confidence.HIGH, ["Not Available."])]
+            return [(Confidence.HIGH, list(_DEFAULT_JUSTIFICATION_ELEMENTS))]
+
+        return justification_list
+
+    @cached_property
+    def justification_report(self) -> list[tuple[Confidence, list]]:
+        """
+        Return a sorted list of justifications based on confidence scores in descending order.
 
+        These justifications are generated from the tables in the database. The report is computed once
+        and reused, because the result tables are not expected to change after the check has run.
+        Note that the elements in the justification will be rendered differently based on their types:
+
+        * a :class:`JustificationType.TEXT` element is displayed in plain text in the HTML report.
+        * a :class:`JustificationType.HREF` element is rendered as a hyperlink in the HTML report.
+
+        Returns
+        -------
+        list[tuple[Confidence, list]]
+        """
         # Sort the justification list based on the confidence score in descending order.
-        return sorted(justification_list, key=lambda item: item[0], reverse=True)
+        return sorted(self._justification_list, key=operator.itemgetter(0), reverse=True)
+
+    @cached_property
+    def top_justification(self) -> list:
+        """Return the justification elements with the highest confidence score.
+
+        This is the same as the elements of the first item in :attr:`justification_report`, without sorting
+        the whole list. Both share the justifications generated from the result tables, which are only
+        computed once.
+
+        Returns
+        -------
+        list
+        """
+        return max(self._justification_list, key=operator.itemgetter(0))[1]
 
 
 @dataclass(frozen=True)
@@ -244,9 +392,8 @@ class CheckResult:
         return {
             "check_id": self.check.check_id,
             "check_description": self.check.check_description,
-            "slsa_requirements": [str(BUILD_REQ_DESC.get(req)) for req in self.check.eval_reqs],
-            # The justification report is sorted and the first element has the highest confidence score.
-            "justification": self.result.justification_report[0][1],
+            "slsa_requirements": list(self.check.eval_req_descriptions),
+            "justification": self.result.top_justification,
             "result_tables": self.result.result_tables,
             "result_type": self.result.result_type,
         }
@@ -273,7 +420,4 @@ def get_result_as_bool(check_result_type: CheckResultType) -> bool:
     -------
     bool
     """
-    if check_result_type in (CheckResultType.FAILED, CheckResultType.UNKNOWN):
-        return False
-
-    return True
+    return check_result_type not in _FALSY_RESULT_TYPES
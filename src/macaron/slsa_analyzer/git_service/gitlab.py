@@ -18,10 +18,10 @@ In the ini configuration file, settings for the ``publicly_hosted`` GitLab servi
 is in the ``[git_service.gitlab.self_hosted]`` section.
 """
 
+import functools
 import logging
 from abc import abstractmethod
 from collections.abc import Callable
-from urllib.parse import ParseResult, urlunparse
 
 from git import GitError
 from pydriller.git import Git
@@ -34,6 +34,68 @@ from macaron.slsa_analyzer.git_service.base_git_service import BaseGitService
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+def _netloc_with_token(hostname: str, access_token: str | None) -> str:
+    """Return the network location of a GitLab service, with the access token embedded if provided.
+
+    Parameters
+    ----------
+    hostname : str
+        The hostname of the GitLab service.
+    access_token : str | None
+        The access token, or an empty value if no token is available.
+
+    Returns
+    -------
+    str
+        The network location to use in a clone URL.
+    """
+    if access_token:
+        return f"oauth2:{access_token}@{hostname}"
+    return hostname
+
+
+@functools.lru_cache(maxsize=256)
+def _build_clone_url(url: str, hostname: str, access_token: str | None) -> str:
+    """Build the clone URL of a repository hosted on a GitLab service.
+
+    The result is cached because the same repository URL is resolved repeatedly during an analysis.
+    The access token is part of the cache key, so a changed token produces a new clone URL.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the repository to be cloned.
+    hostname : str
+        The hostname of the GitLab service.
+    access_token : str | None
+        The access token, or an empty value if no token is available.
+
+    Returns
+    -------
+    str
+        The clone URL, containing the access token if provided.
+
+    Raises
+    ------
+    CloneError
+        If there is an error parsing the URL.
+    """
+    url_parse_result = git_url.parse_remote_url(
+        url,
+        allowed_git_service_hostnames=[hostname],
+    )
+    if not url_parse_result:
+        raise CloneError(
+            f"Cannot clone the repo '{url}' due to the URL format being invalid or not supported by Macaron."
+        )
+
+    # Construct clone URL from ``urlparse`` result, with or without an access token.
+    # https://docs.gitlab.com/ee/gitlab-basics/start-using-git.html#clone-using-a-token
+    # The parsed URL only has the scheme, netloc and path components, and the path is relative to the host.
+    netloc = _netloc_with_token(hostname, access_token)
+    return f"{url_parse_result.scheme}://{netloc}/{url_parse_result.path.lstrip('/')}"
+
+
 class GitLab(BaseGitService):
     """This class contains the spec of the GitLab service."""
 
@@ -77,35 +139,7 @@ class GitLab(BaseGitService):
             logger.debug("Cannot clone with a Git service having no hostname.")
             raise CloneError(f"Cannot clone the repo '{url}' due to an internal error.")
 
-        url_parse_result = git_url.parse_remote_url(
-            url,
-            allowed_git_service_hostnames=[self.hostname],
-        )
-        if not url_parse_result:
-            raise CloneError(
-                f"Cannot clone the repo '{url}' due to the URL format being invalid or not supported by Macaron."
-            )
-
-        # Construct clone URL from ``urlparse`` result, with or without an access token.
-        # https://docs.gitlab.com/ee/gitlab-basics/start-using-git.html#clone-using-a-token
-        access_token: str | None = self.token_function()
-        if access_token:
-            clone_url_netloc = f"oauth2:{access_token}@{self.hostname}"
-        else:
-            clone_url_netloc = self.hostname
-
-        clone_url = urlunparse(
-            ParseResult(
-                scheme=url_parse_result.scheme,
-                netloc=clone_url_netloc,
-                path=url_parse_result.path,
-                params="",
-                query="",
-                fragment="",
-            )
-        )
-
-        return clone_url
+        return _build_clone_url(url, self.hostname, self.token_function())
 
     def clone_repo(self, clone_dir: str, url: str) -> None:
         """Clone a repository.
@@ -162,7 +196,8 @@ class GitLab(BaseGitService):
         """Checkout the branch and commit specified by the user of a repository.
 
         For GitLab, this method set the origin remote URL of the target repository to the token-embedded URL if
-        a token is available before performing the checkout operation.
+        a token is available before performing the checkout operation. If the clone URL is the same as the
+        origin remote URL, the origin remote URL is left untouched.
 
         After the checkout operation finishes, the origin remote URL is set back again to ensure that no token-embedded
         URL remains.
@@ -200,6 +235,10 @@ class GitLab(BaseGitService):
         except CloneError as error:
             raise RepoCheckOutError("Cannot parse the remote origin URL of this repository.") from error
 
+        # If the clone URL is the same as the origin remote URL, there is no need to change it back and forth.
+        if reconstructed_url == remote_origin_url:
+            return self._check_out_repo_target(git_obj, branch, digest, offline_mode)
+
         try:
             # Even though the documentation of ``set_url`` function does not explicitly mention
             # ``ValueError`` or ``GitError`` as raised errors, these errors might be raised based
@@ -228,6 +267,37 @@ class GitLab(BaseGitService):
 
         return git_obj
 
+    def _check_out_repo_target(self, git_obj: Git, branch: str, digest: str, offline_mode: bool) -> Git:
+        """Checkout the branch and commit of a repository without changing its origin remote URL.
+
+        Parameters
+        ----------
+        git_obj : Git
+            The Git object for the repository to check out.
+        branch : str
+            The branch to check out.
+        digest : str
+            The sha of the commit to check out.
+        offline_mode: bool
+            If true, no fetching is performed.
+
+        Returns
+        -------
+        Git
+            The same Git object from the input.
+
+        Raises
+        ------
+        RepoCheckOutError
+            If there is error while checkout the specific branch and digest.
+        """
+        if not git_url.check_out_repo_target(git_obj, branch, digest, offline_mode):
+            raise RepoCheckOutError(
+                f"Failed to check out branch {branch} and commit {digest} for repo {git_obj.project_name}."
+            )
+
+        return git_obj
+
 
 class SelfHostedGitLab(GitLab):
     """The self-hosted GitLab instance."""
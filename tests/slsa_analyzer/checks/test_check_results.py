@@ -9,6 +9,8 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from macaron.database.table_definitions import CheckFacts
 from macaron.slsa_analyzer.checks.check_result import (
+    CheckInfo,
+    CheckResult,
     CheckResultData,
     CheckResultType,
     Confidence,
@@ -16,6 +18,7 @@ from macaron.slsa_analyzer.checks.check_result import (
     EvidenceWeightMap,
     JustificationType,
 )
+from macaron.slsa_analyzer.slsa_req import BUILD_REQ_DESC, ReqName
 
 
 class MockFacts(CheckFacts):
@@ -29,6 +32,9 @@ class MockFacts(CheckFacts):
     #: The name of the tool used to build.
     test_name: Mapped[str] = mapped_column(String, nullable=False, info={"justification": JustificationType.TEXT})
 
+    #: A column with a justification type that is not supported.
+    test_other: Mapped[str | None] = mapped_column(String, nullable=True, info={"justification": "other"})
+
     __mapper_args__ = {
         "polymorphic_identity": "_test_check",
     }
@@ -38,7 +44,7 @@ def test_check_result_justification() -> None:
     """Test that the check result justifications are sorted in a descending order based on the confidence score."""
     check_result_data = CheckResultData(
         result_tables=[
-            MockFacts(test_name="foo", confidence=Confidence.LOW),
+            MockFacts(test_name="foo", test_other="ignored", confidence=Confidence.LOW),
             MockFacts(test_name="bar", confidence=Confidence.HIGH),
             MockFacts(test_name="baz", confidence=Confidence.MEDIUM),
         ],
@@ -94,3 +100,92 @@ def test_confidence_normalization(evidence_list: list[Evidence], expected_result
     evidence_weight_map = EvidenceWeightMap(evidence_list=evidence_list)
 
     assert Confidence.normalize(evidence_weight_map) == expected_result
+
+
+def test_evidence_weight_map_scores_updated() -> None:
+    """Test that the scores reflect the evidence results updated after they have been computed."""
+    evidence_weight_map = EvidenceWeightMap(
+        evidence_list=[
+            Evidence(name="foo", found=False, weight=1),
+            Evidence(name="bar", found=False, weight=2),
+        ]
+    )
+    assert evidence_weight_map.get_scores() == (0, 3)
+
+    evidence_weight_map.update_result(name="bar", found=True)
+    assert evidence_weight_map.get_scores() == (2, 3)
+
+    evidence_weight_map.add(Evidence(name="baz", found=True, weight=4))
+    assert evidence_weight_map.get_score() == 6
+    assert evidence_weight_map.get_max_score() == 7
+
+
+def test_evidence_weight_map_iter() -> None:
+    """Test that iterating over the map yields the evidences with their latest results."""
+    evidence_weight_map = EvidenceWeightMap(
+        evidence_list=[
+            Evidence(name="foo", found=False, weight=1),
+            Evidence(name="bar", found=False, weight=2),
+        ]
+    )
+    evidence_weight_map.update_result(name="foo", found=True)
+    evidence_weight_map.add(Evidence(name="bar", found=True, weight=3))
+
+    assert list(evidence_weight_map) == [
+        Evidence(name="foo", found=True, weight=1),
+        Evidence(name="bar", found=True, weight=3),
+    ]
+
+
+def test_check_result_top_justification() -> None:
+    """Test that the top justification is the first element of the sorted justification report."""
+    check_result_data = CheckResultData(
+        result_tables=[
+            MockFacts(test_name="foo", confidence=Confidence.MEDIUM),
+            MockFacts(test_name="bar", confidence=Confidence.HIGH),
+            MockFacts(test_name="baz", confidence=Confidence.HIGH),
+        ],
+        result_type=CheckResultType.PASSED,
+    )
+    assert check_result_data.top_justification == ["test_name: bar"]
+    assert check_result_data.top_justification == check_result_data.justification_report[0][1]
+
+    empty_result_data = CheckResultData(result_tables=[], result_type=CheckResultType.FAILED)
+    assert empty_result_data.top_justification == ["Not Available."]
+
+
+def test_check_result_justification_cached() -> None:
+    """Test that the justification report is only computed once for a check result."""
+    check_result_data = CheckResultData(
+        result_tables=[MockFacts(test_name="foo", confidence=Confidence.HIGH)],
+        result_type=CheckResultType.PASSED,
+    )
+    assert check_result_data.justification_report is check_result_data.justification_report
+
+
+@pytest.mark.parametrize(
+    "result_tables",
+    [
+        [],
+        [MockFacts(test_name="", confidence=Confidence.LOW)],
+    ],
+)
+def test_check_result_justification_not_available(result_tables: list[CheckFacts]) -> None:
+    """Test that a default justification is returned when the check has no justifications."""
+    check_result_data = CheckResultData(result_tables=result_tables, result_type=CheckResultType.FAILED)
+    assert check_result_data.justification_report == [(Confidence.HIGH, ["Not Available."])]
+
+    # The default justification must not be shared between check results.
+    check_result_data.top_justification.append("foo")
+    other_result_data = CheckResultData(result_tables=result_tables, result_type=CheckResultType.FAILED)
+    assert other_result_data.top_justification == ["Not Available."]
+
+
+def test_check_result_summary_slsa_requirements() -> None:
+    """Test that the summary of a check result contains the descriptions of the SLSA requirements."""
+    check_result = CheckResult(
+        check=CheckInfo(check_id="mcn_test_1", check_description="Test check.", eval_reqs=[ReqName.VCS]),
+        result=CheckResultData(result_tables=[], result_type=CheckResultType.PASSED),
+    )
+    assert check_result.get_summary()["slsa_requirements"] == [str(BUILD_REQ_DESC[ReqName.VCS])]
+    assert check_result.check.eval_req_descriptions is check_result.check.eval_req_descriptions
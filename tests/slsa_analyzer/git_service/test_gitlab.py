@@ -6,12 +6,13 @@
 import os
 from pathlib import Path
 from unittest import mock
+from urllib.parse import ParseResult, urlunparse
 
 import pytest
 from pydriller.git import Git
 
 from macaron.config.defaults import load_defaults
-from macaron.errors import ConfigurationError
+from macaron.errors import ConfigurationError, RepoCheckOutError
 from macaron.slsa_analyzer import git_url
 from macaron.slsa_analyzer.git_service.gitlab import PubliclyHostedGitLab, SelfHostedGitLab
 from tests.slsa_analyzer.mock_git_utils import commit_files, initiate_repo
@@ -95,6 +96,38 @@ def test_construct_clone_url_for_self_hosted_gitlab(
         assert gitlab.construct_clone_url(repo_url) == clone_url
 
 
+@pytest.mark.parametrize(
+    ("repo_url", "token"),
+    [
+        ("https://gitlab.com/owner/repo.git", ""),
+        ("https://gitlab.com/owner/repo/", ""),
+        ("https://gitlab.com/owner/repo/", "abcxyz"),
+        ("https://gitlab.com/owner/repo/tree/main/", "abcxyz"),
+        ("git@gitlab.com:owner/repo.git", "abcxyz"),
+        ("ssh://git@gitlab.com:7999/owner/repo.git/", "abcxyz"),
+    ],
+)
+def test_construct_clone_url_matches_urlunparse(repo_url: str, token: str) -> None:
+    """Test if the ``construct_clone_url`` method produces the same URL as assembling it with ``urlunparse``."""
+    with mock.patch("macaron.config.global_config.global_config.gl_token", token):
+        gitlab = PubliclyHostedGitLab()
+        gitlab.load_defaults()
+
+        url_parse_result = git_url.parse_remote_url(repo_url, allowed_git_service_hostnames=["gitlab.com"])
+        assert url_parse_result
+        expected_url = urlunparse(
+            ParseResult(
+                scheme=url_parse_result.scheme,
+                netloc=f"oauth2:{token}@gitlab.com" if token else "gitlab.com",
+                path=url_parse_result.path,
+                params="",
+                query="",
+                fragment="",
+            )
+        )
+        assert gitlab.construct_clone_url(repo_url) == expected_url
+
+
 def test_self_hosted_gitlab_without_env_set(tmp_path: Path) -> None:
     """Test if the ``load_defaults`` method raises error if the required env variable is not set."""
     user_config_input = """
@@ -206,3 +239,73 @@ def test_origin_remote_url_masking(self_hosted_gitlab: Git, expected_origin_url:
 
             gitlab.check_out_repo(self_hosted_gitlab, branch="", digest="", offline_mode=False)
             assert git_url.get_remote_origin_of_local_repo(self_hosted_gitlab) == expected_origin_url
+
+
+@pytest.mark.parametrize(
+    ("origin_url", "clone_url"),
+    [
+        ("https://gitlab.com/owner/repo.git", None),
+        ("git@gitlab.com:owner/repo.git", "https://gitlab.com/owner/repo.git"),
+        ("ssh://git@gitlab.com:7999/owner/repo.git/", "https://gitlab.com/owner/repo.git"),
+    ],
+)
+def test_check_out_repo_without_token(origin_url: str, clone_url: str | None) -> None:
+    """Test if the ``check_out_repo`` method only sets the origin remote URL when the clone URL differs from it."""
+    git_obj = mock.MagicMock()
+    set_url = git_obj.repo.remote.return_value.set_url
+    with mock.patch("macaron.config.global_config.global_config.gl_token", ""):
+        gitlab = PubliclyHostedGitLab()
+        gitlab.load_defaults()
+
+        with (
+            mock.patch("macaron.slsa_analyzer.git_url.get_remote_origin_of_local_repo", return_value=origin_url),
+            mock.patch("macaron.slsa_analyzer.git_url.check_out_repo_target", return_value=True),
+        ):
+            assert gitlab.check_out_repo(git_obj, branch="", digest="", offline_mode=True) is git_obj
+
+        if clone_url:
+            assert set_url.call_args_list == [mock.call(clone_url, origin_url), mock.call(origin_url, clone_url)]
+        else:
+            set_url.assert_not_called()
+
+        with (
+            mock.patch("macaron.slsa_analyzer.git_url.get_remote_origin_of_local_repo", return_value=origin_url),
+            mock.patch("macaron.slsa_analyzer.git_url.check_out_repo_target", return_value=False),
+        ):
+            with pytest.raises(RepoCheckOutError):
+                gitlab.check_out_repo(git_obj, branch="", digest="", offline_mode=True)
+
+
+def test_check_out_repo_invalid_origin() -> None:
+    """Test if the ``check_out_repo`` method raises an error if the origin remote is missing or invalid."""
+    git_obj = mock.MagicMock()
+    with mock.patch("macaron.config.global_config.global_config.gl_token", ""):
+        gitlab = PubliclyHostedGitLab()
+        gitlab.load_defaults()
+
+        with mock.patch(
+            "macaron.slsa_analyzer.git_url.get_remote_origin_of_local_repo", return_value="https://github.com/owner/repo"
+        ):
+            with pytest.raises(RepoCheckOutError):
+                gitlab.check_out_repo(git_obj, branch="", digest="", offline_mode=True)
+
+        git_obj.repo.remote.side_effect = ValueError
+        with pytest.raises(RepoCheckOutError):
+            gitlab.check_out_repo(git_obj, branch="", digest="", offline_mode=True)
+
+
+def test_check_out_repo_with_unchanged_origin_url() -> None:
+    """Test if the ``check_out_repo`` method does not set the origin remote URL when the clone URL is the same."""
+    git_obj = mock.MagicMock()
+    origin_url = "https://gitlab.com/owner/repo"
+    with mock.patch("macaron.config.global_config.global_config.gl_token", "abcxyz"):
+        gitlab = PubliclyHostedGitLab()
+        gitlab.load_defaults()
+
+        with (
+            mock.patch("macaron.slsa_analyzer.git_url.get_remote_origin_of_local_repo", return_value=origin_url),
+            mock.patch.object(gitlab, "construct_clone_url", return_value=origin_url),
+            mock.patch("macaron.slsa_analyzer.git_url.check_out_repo_target", return_value=True),
+        ):
+            assert gitlab.check_out_repo(git_obj, branch="", digest="", offline_mode=True) is git_obj
+            git_obj.repo.remote.return_value.set_url.assert_not_called()